@@ -2,27 +2,28 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
-from cli.parser import build_parser
+from cli.parser import build_parser_cached
 from config.settings import MergeSettings
 from core.merger import PdfMergerService
 from core.orchestrator import MergeOrchestrator
 from core.scanner import PdfScanner
-from utils.console import ConsoleMessenger
+from utils.console import DEFAULT_MESSENGER, ConsoleMessenger
 
 
 @dataclass
 class PdfMergerApp:
     """Orchestrates CLI -> Core integration."""
 
-    messenger: ConsoleMessenger = field(default_factory=ConsoleMessenger)
+    messenger: ConsoleMessenger = field(default_factory=lambda: DEFAULT_MESSENGER)
 
     def run(self, argv: Optional[List[str]] = None) -> int:
-        parser = build_parser()
+        parser = build_parser_cached()
         args = parser.parse_args(argv)
 
         print(
@@ -65,15 +66,13 @@ class PdfMergerApp:
         if outcome is None:
             return 0
 
-        print(
-            self.messenger.success(f"Successfully created: {outcome.output_path.name}")
-        )
-        print(self.messenger.info(f"Total pages: {outcome.total_pages}"))
-        print(self.messenger.info(f"File size: {outcome.file_size_mb:.2f} MB"))
-        print(
+        self.messenger.emit(
+            self.messenger.success(f"Successfully created: {outcome.output_path.name}"),
+            self.messenger.info(f"Total pages: {outcome.total_pages}"),
+            self.messenger.info(f"File size: {outcome.file_size_mb:.2f} MB"),
             self.messenger.success(
                 f"🎉 Mission Accomplished! Your merged PDF is ready: {outcome.output_path}"
-            )
+            ),
         )
         return 0
 
@@ -85,14 +84,18 @@ class PdfMergerApp:
         destination: Optional[str],
     ) -> MergeSettings:
         return MergeSettings(
-            folder_path=Path(folder_path).expanduser().resolve(),
+            folder_path=self._absolute_path(folder_path),
             recursive=recursive,
             output_name=output,
-            destination=Path(destination).expanduser().resolve()
-            if destination
-            else None,
+            destination=self._absolute_path(destination) if destination else None,
         )
 
+    @staticmethod
+    def _absolute_path(raw: str) -> Path:
+        # abspath normalises lexically, sparing resolve()'s per-component
+        # readlink/stat calls.
+        return Path(os.path.abspath(os.path.expanduser(raw)))
+
 
 def main(argv: Optional[List[str]] = None) -> int:
     app = PdfMergerApp()
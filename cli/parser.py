@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from textwrap import dedent
 
 
@@ -41,3 +42,13 @@ def build_parser() -> argparse.ArgumentParser:
     )
 
     return parser
+
+
+@lru_cache(maxsize=1)
+def build_parser_cached() -> argparse.ArgumentParser:
+    """Return a shared parser for repeated in-process runs.
+
+    parse_args() leaves the parser untouched, so one instance can serve every
+    call; use build_parser() when a fresh, mutable parser is needed.
+    """
+    return build_parser()
@@ -9,3 +9,6 @@ SUPPORTED_EXTENSIONS = (PDF_EXTENSION,)
 TIMESTAMP_PATTERN = "%Y%m%d_%H%M%S"
 MAX_PREVIEW_FILES = 10
 DEFAULT_DESTINATION = Path(".")
+MAX_READ_WORKERS = 8
+OUTPUT_BUFFER_SIZE = 1 << 20
+PROGRESS_BAR_MIN_FILES = 32
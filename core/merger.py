@@ -2,35 +2,106 @@
 
 from __future__ import annotations
 
+import os
+import sys
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Iterable
-
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Deque,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from config import constants
 from utils.console import ConsoleMessenger
 
-try:
-    from pypdf import PdfReader, PdfWriter
+from .scanner import PdfEntry
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from concurrent.futures import Future
+
+PDF_IMPORT_ERROR = "Install either 'pypdf' or 'PyPDF2' to use the merger"
+
+# Heavy optional dependencies are imported on first use so that `--help` and
+# early error exits do not pay their import cost.
+_PDF: Optional[SimpleNamespace] = None
+_TQDM: Optional[SimpleNamespace] = None
+
+
+def _load_pdf() -> SimpleNamespace:
+    """Import the PDF backend once, preferring pypdf over PyPDF2."""
+    global _PDF
+    if _PDF is None:
+        try:
+            from pypdf import PdfReader, PdfWriter
+
+            library = "pypdf"
+        except ImportError:  # pragma: no cover - fallback runtime path
+            try:
+                from PyPDF2 import PdfReader, PdfWriter
+
+                library = "PyPDF2"
+            except ImportError:  # pragma: no cover - runtime guard
+                PdfReader = PdfWriter = None  # type: ignore[assignment]
+                library = "Unavailable"
+        _PDF = SimpleNamespace(
+            PdfReader=PdfReader,
+            PdfWriter=PdfWriter,
+            library=library,
+            error=None if PdfReader is not None else PDF_IMPORT_ERROR,
+        )
+    return _PDF
+
 
-    PDF_LIB = "pypdf"
-    PDF_IMPORT_ERROR: str | None = None
-except ImportError:  # pragma: no cover - fallback runtime path
+def _load_tqdm() -> SimpleNamespace:
+    """Import tqdm once; `tqdm` is None when it is not installed."""
+    global _TQDM
+    if _TQDM is None:
+        try:  # pragma: no cover - optional dependency
+            from tqdm import tqdm
+        except ImportError:  # pragma: no cover - fallback path
+            tqdm = None
+        _TQDM = SimpleNamespace(tqdm=tqdm, available=tqdm is not None)
+    return _TQDM
+
+
+def _read_pdf(reader_cls: Any, pdf_path: str) -> Tuple[Any, BinaryIO]:
+    """Open one PDF and parse its page tree; the caller closes the handle."""
+    handle = open(pdf_path, "rb")
     try:
-        from PyPDF2 import PdfReader, PdfWriter
+        reader = reader_cls(handle)
+        len(reader.pages)
+    except BaseException:
+        handle.close()
+        raise
+    return reader, handle
+
 
-        PDF_LIB = "PyPDF2"
-        PDF_IMPORT_ERROR = None
-    except ImportError as exc:  # pragma: no cover - runtime guard
-        PdfReader = PdfWriter = None  # type: ignore[assignment]
-        PDF_LIB = "Unavailable"
-        PDF_IMPORT_ERROR = "Install either 'pypdf' or 'PyPDF2' to use the merger"
+def _close_pending(window: Iterable[Future]) -> None:
+    """Close handles of reads that finished but were never appended."""
+    for future in window:
+        if not future.cancelled() and future.exception() is None:
+            future.result()[1].close()
 
-try:  # pragma: no cover - optional dependency
-    from tqdm import tqdm
 
-    HAS_TQDM = True
-except ImportError:  # pragma: no cover - fallback path
-    tqdm = None
-    HAS_TQDM = False
+def _append_reader(pdf_writer: Any, reader: Any) -> None:
+    """Copy every page of `reader` into `pdf_writer` in a single call."""
+    if hasattr(pdf_writer, "append"):
+        # Outlines are skipped so the output matches per-page add_page copies.
+        pdf_writer.append(reader, import_outline=False)
+    elif hasattr(pdf_writer, "append_pages_from_reader"):
+        pdf_writer.append_pages_from_reader(reader)
+    else:  # pragma: no cover - very old PyPDF2
+        for page in reader.pages:
+            pdf_writer.add_page(page)
 
 
 @dataclass(frozen=True)
@@ -46,53 +117,110 @@ class MergeOutcome:
 class PdfMergerService:
     """Responsible for combining PDFs into a single file."""
 
+    __slots__ = ("messenger",)
+
     messenger: ConsoleMessenger
 
     @property
     def library_name(self) -> str:
-        return PDF_LIB
+        return _load_pdf().library
 
     @property
     def has_progress_bar(self) -> bool:
-        return HAS_TQDM
-
-    def merge(self, pdf_files: Iterable[Path], output_path: Path) -> MergeOutcome:
-        if PDF_IMPORT_ERROR:
-            raise RuntimeError(PDF_IMPORT_ERROR)
-
-        pdf_writer = PdfWriter()
-        files = list(pdf_files)
+        return _load_tqdm().available
+
+    def merge(
+        self,
+        pdf_files: Iterable[Union[PdfEntry, os.PathLike[str], str]],
+        output_path: Path,
+    ) -> MergeOutcome:
+        # Imported here to keep concurrent.futures off the `--help` path.
+        from concurrent.futures import ThreadPoolExecutor
+
+        pdf = _load_pdf()
+        if pdf.error:
+            raise RuntimeError(pdf.error)
+        progress = _load_tqdm()
+
+        pdf_writer = pdf.PdfWriter()
+        files = [PdfEntry.from_path(pdf_file) for pdf_file in pdf_files]
         total_pages = 0
 
+        # tqdm's per-update cost only pays off for larger batches; small merges
+        # get a single self-overwriting status line on a terminal, or one line
+        # per file when stdout is piped or logged.
+        use_bar = progress.available and len(files) >= constants.PROGRESS_BAR_MIN_FILES
         progress_bar = (
-            tqdm(files, desc="Processing PDFs", unit="file") if HAS_TQDM else None
+            progress.tqdm(files, desc="Processing PDFs", unit="file")
+            if use_bar
+            else None
         )
         iterator = progress_bar or files
-
-        for index, pdf_path in enumerate(iterator, start=1):
-            if progress_bar is None:
-                print(f"  📄 Processing: {pdf_path.name} ({index}/{len(files)})")
-            try:
-                with open(pdf_path, "rb") as handle:
-                    reader = PdfReader(handle)
-                    for page in reader.pages:
-                        pdf_writer.add_page(page)
-                    pages_added = len(reader.pages)
+        inline_status = progress_bar is None and sys.stdout.isatty()
+        status_shown = False
+
+        # Readers are parsed concurrently; pages are still appended to the
+        # writer on this thread, in input order. Only `workers` files are in
+        # flight at a time, each read lazily from its own open handle, so at
+        # most `workers` parsed readers are alive at once.
+        workers = max(1, min(constants.MAX_READ_WORKERS, len(files)))
+        queued = iter(files)
+        window: Deque[Future] = deque()
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for entry in islice(queued, workers):
+                window.append(executor.submit(_read_pdf, pdf.PdfReader, entry.path))
+
+            for index, entry in enumerate(iterator, start=1):
+                future = window.popleft()
+                upcoming = next(queued, None)
+                if upcoming is not None:
+                    window.append(
+                        executor.submit(_read_pdf, pdf.PdfReader, upcoming.path)
+                    )
+                if progress_bar is None and not inline_status:
+                    print(f"  📄 Processing: {entry.name} ({index}/{len(files)})")
+                try:
+                    reader, handle = future.result()
+                    with handle:
+                        pages_before = len(pdf_writer.pages)
+                        _append_reader(pdf_writer, reader)
+                        pages_added = len(pdf_writer.pages) - pages_before
+                        del reader
                     total_pages += pages_added
                     if progress_bar is not None:
                         progress_bar.set_postfix(
                             {"Pages": total_pages, "Current": f"{pages_added}p"}
                         )
-                    else:
-                        print(f"    ✓ Added {pages_added} pages")
-            except Exception as exc:
-                print(self.messenger.error(f"Failed to process {pdf_path.name}: {exc}"))
+                    elif inline_status:
+                        sys.stdout.write(
+                            f"\r  📄 {entry.name} ({index}/{len(files)})"
+                            f"  pages={total_pages}\033[K"
+                        )
+                        sys.stdout.flush()
+                        status_shown = True
+                except Exception as exc:
+                    if status_shown:
+                        sys.stdout.write("\n")
+                        status_shown = False
+                    print(
+                        self.messenger.error(f"Failed to process {entry.name}: {exc}")
+                    )
+                # Release the parsed reader before the next file is appended.
+                del future
+        finally:
+            for future in window:
+                future.cancel()
+            executor.shutdown(wait=True)
+            _close_pending(window)
 
         if progress_bar is not None:
             progress_bar.close()
+        elif status_shown:
+            sys.stdout.write("\n")
 
         print(self.messenger.info(f"Saving merged PDF to: {output_path}"))
-        with open(output_path, "wb") as handle:
+        with open(output_path, "wb", buffering=constants.OUTPUT_BUFFER_SIZE) as handle:
             pdf_writer.write(handle)
 
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from config import constants
 from config.settings import MergeSettings
@@ -24,6 +24,8 @@ from .scanner import PdfScanner
 class MergeOrchestrator:
     """High-level workflow orchestrator."""
 
+    __slots__ = ("scanner", "merger", "messenger")
+
     scanner: PdfScanner
     merger: PdfMergerService
     messenger: ConsoleMessenger
@@ -36,49 +38,62 @@ class MergeOrchestrator:
         if not folder.is_dir():
             raise NotADirectoryError(f"Path is not a directory: {folder}")
 
-        print(self.messenger.info(f"Source folder: {folder}"))
-        print(
+        self.messenger.emit(
+            self.messenger.info(f"Source folder: {folder}"),
             self.messenger.info(
                 f"Recursive search: {'Yes' if settings.recursive else 'No'}"
-            )
+            ),
         )
 
         pdf_files = self.scanner.scan(settings)
         if not pdf_files:
-            print(self.messenger.warning("No PDF files found in the specified folder."))
+            lines = [
+                self.messenger.warning("No PDF files found in the specified folder.")
+            ]
             if not settings.recursive:
-                print(self.messenger.info("Try running again with --recursive"))
+                lines.append(self.messenger.info("Try running again with --recursive"))
+            self.messenger.emit(*lines)
             return None
 
-        print(self.messenger.success(f"Found {len(pdf_files)} PDF files"))
+        # Shown before the destination is created so the count is visible even
+        # if mkdir fails.
+        self.messenger.emit(self.messenger.success(f"Found {len(pdf_files)} PDF files"))
+        lines: List[str] = []
         destination = self._resolve_destination(settings.destination, folder)
         output_name = self._resolve_output_name(settings, folder)
         raw_output_path = destination / output_name
         output_path = ensure_unique_output(raw_output_path)
 
         if output_path != raw_output_path:
-            print(
+            lines.append(
                 self.messenger.warning(f"Output file exists, using: {output_path.name}")
             )
 
-        preview = limit_preview(pdf_files, constants.MAX_PREVIEW_FILES)
-        self.messenger.print_files(
-            preview,
-            preview_limit=constants.MAX_PREVIEW_FILES,
-            total=len(pdf_files),
+        preview = limit_preview(
+            (pdf_file.name for pdf_file in pdf_files), constants.MAX_PREVIEW_FILES
+        )
+        lines.extend(
+            self.messenger.format_files(
+                preview,
+                preview_limit=constants.MAX_PREVIEW_FILES,
+                total=len(pdf_files),
+            )
         )
 
-        print(self.messenger.info(f"Using {self.merger.library_name} library"))
+        lines.append(self.messenger.info(f"Using {self.merger.library_name} library"))
 
         if not self.merger.has_progress_bar:
-            print(
+            lines.append(
                 self.messenger.warning(
                     "Install 'tqdm' for progress bars: pip install tqdm"
                 )
             )
 
-        print(self.messenger.bold(f"\nReady to merge {len(pdf_files)} PDF files!"))
-        print(self.messenger.info(f"Output file: {output_path}"))
+        lines.append(
+            self.messenger.bold(f"\nReady to merge {len(pdf_files)} PDF files!")
+        )
+        lines.append(self.messenger.info(f"Output file: {output_path}"))
+        self.messenger.emit(*lines)
 
         outcome = self.merger.merge(pdf_files, output_path)
         return outcome
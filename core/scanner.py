@@ -2,21 +2,75 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from pathlib import Path
-from typing import List
+from operator import attrgetter
+from typing import Iterator, List, Union
 
+from config import constants
 from config.settings import MergeSettings
 
 
+def _is_file(entry: os.DirEntry) -> bool:
+    # Broken or looping symlinks raise OSError here; Path.is_file() treated
+    # them as "not a file", so they are skipped rather than aborting the scan.
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+@dataclass(frozen=True)
+class PdfEntry:
+    """A discovered PDF, kept as plain strings for cheap access while merging."""
+
+    path: str
+    name: str
+    sort_key: str
+
+    @classmethod
+    def from_path(cls, path: Union[PdfEntry, os.PathLike[str], str]) -> PdfEntry:
+        """Wrap a plain path, passing existing entries through unchanged."""
+        if isinstance(path, cls):
+            return path
+        raw = os.fspath(path)
+        name = os.path.basename(raw)
+        return cls(path=raw, name=name, sort_key=name.lower())
+
+
 @dataclass
 class PdfScanner:
     """Discovers PDF files based on provided settings."""
 
-    def scan(self, settings: MergeSettings) -> List[Path]:
-        pattern = "**/*.pdf" if settings.recursive else "*.pdf"
-        pdf_files = sorted(
-            settings.folder_path.glob(pattern), key=lambda path: path.name.lower()
-        )
+    __slots__ = ()
+
+    def scan(self, settings: MergeSettings) -> List[PdfEntry]:
+        """Return every matching PDF, sorted case-insensitively by name."""
+        entries = list(self.iter_scan(settings))
+        entries.sort(key=attrgetter("sort_key"))
+        return entries
+
+    def iter_scan(self, settings: MergeSettings) -> Iterator[PdfEntry]:
+        """Yield matching PDFs as they are discovered, in directory order."""
+        # os.scandir exposes cached entry types, so no extra stat() per file.
+        # The lower-cased name is computed once and reused as the sort key.
+        extension = constants.PDF_EXTENSION
+        stack = [os.fspath(settings.folder_path)]
 
-        return [path for path in pdf_files if path.is_file()]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                # Unreadable directories are skipped, as Path.glob did.
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if settings.recursive:
+                            stack.append(entry.path)
+                        continue
+                    sort_key = entry.name.lower()
+                    if sort_key.endswith(extension) and _is_file(entry):
+                        yield PdfEntry(
+                            path=entry.path, name=entry.name, sort_key=sort_key
+                        )
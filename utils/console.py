@@ -2,42 +2,77 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable, List
 
 from .colors import DEFAULT_PALETTE, ColorPalette
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConsoleMessenger:
     """Formats messages with ANSI styles for consistent UX."""
 
     palette: ColorPalette = DEFAULT_PALETTE
+    _banner_pfx: str = field(init=False, repr=False, compare=False)
+    _success_pfx: str = field(init=False, repr=False, compare=False)
+    _error_pfx: str = field(init=False, repr=False, compare=False)
+    _warning_pfx: str = field(init=False, repr=False, compare=False)
+    _info_pfx: str = field(init=False, repr=False, compare=False)
+    _cyan_pfx: str = field(init=False, repr=False, compare=False)
+    _bold_pfx: str = field(init=False, repr=False, compare=False)
+    _endc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Both the messenger and its palette are frozen, so style prefixes can
+        # be built once; object.__setattr__ bypasses the frozen guard.
+        palette = self.palette
+        object.__setattr__(self, "_banner_pfx", f"{palette.header}{palette.bold}")
+        object.__setattr__(self, "_success_pfx", f"{palette.ok_green}✅ ")
+        object.__setattr__(self, "_error_pfx", f"{palette.fail}❌ ")
+        object.__setattr__(self, "_warning_pfx", f"{palette.warning}⚠️  ")
+        object.__setattr__(self, "_info_pfx", f"{palette.ok_blue}ℹ️  ")
+        object.__setattr__(self, "_cyan_pfx", palette.ok_cyan)
+        object.__setattr__(self, "_bold_pfx", palette.bold)
+        object.__setattr__(self, "_endc", palette.endc)
 
     def banner(self, message: str) -> str:
-        return f"{self.palette.header}{self.palette.bold}{message}{self.palette.endc}"
+        return f"{self._banner_pfx}{message}{self._endc}"
 
     def success(self, message: str) -> str:
-        return f"{self.palette.ok_green}✅ {message}{self.palette.endc}"
+        return f"{self._success_pfx}{message}{self._endc}"
 
     def error(self, message: str) -> str:
-        return f"{self.palette.fail}❌ {message}{self.palette.endc}"
+        return f"{self._error_pfx}{message}{self._endc}"
 
     def warning(self, message: str) -> str:
-        return f"{self.palette.warning}⚠️  {message}{self.palette.endc}"
+        return f"{self._warning_pfx}{message}{self._endc}"
 
     def info(self, message: str) -> str:
-        return f"{self.palette.ok_blue}ℹ️  {message}{self.palette.endc}"
+        return f"{self._info_pfx}{message}{self._endc}"
 
     def cyan(self, message: str) -> str:
-        return f"{self.palette.ok_cyan}{message}{self.palette.endc}"
+        return f"{self._cyan_pfx}{message}{self._endc}"
 
     def bold(self, message: str) -> str:
-        return f"{self.palette.bold}{message}{self.palette.endc}"
+        return f"{self._bold_pfx}{message}{self._endc}"
 
-    def print_files(self, items: Iterable[str], preview_limit: int, total: int) -> None:
-        print(self.cyan("\n📋 Files to merge:"))
+    def emit(self, *lines: str) -> None:
+        """Print several lines with a single write to stdout."""
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def format_files(
+        self, items: Iterable[str], preview_limit: int, total: int
+    ) -> List[str]:
+        lines = [self.cyan("\n📋 Files to merge:")]
         for idx, value in enumerate(items, start=1):
-            print(f"  {idx:2d}. {value}")
+            lines.append(f"  {idx:2d}. {value}")
         if total > preview_limit:
-            print(f"  ... and {total - preview_limit} more files")
+            lines.append(f"  ... and {total - preview_limit} more files")
+        return lines
+
+    def print_files(self, items: Iterable[str], preview_limit: int, total: int) -> None:
+        self.emit(*self.format_files(items, preview_limit, total))
+
+
+DEFAULT_MESSENGER = ConsoleMessenger()
@@ -4,16 +4,20 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Iterable, List
 
 from config import constants
 
+_INVALID_CHARS = re.compile(r'[<>:"/\\|?*]')
+_UNDERSCORES = re.compile(r"_+")
+
 
 def sanitize_filename(filename: str) -> str:
     """Remove invalid characters and compact underscores."""
-    sanitized = re.sub(r'[<>:"/\\|?*]', "_", filename)
-    sanitized = re.sub(r"_+", "_", sanitized)
+    sanitized = _INVALID_CHARS.sub("_", filename)
+    sanitized = _UNDERSCORES.sub("_", sanitized)
     return sanitized.strip("_ ")
 
 
@@ -32,11 +36,6 @@ def ensure_unique_output(path: Path) -> Path:
     return path.with_name(f"{path.stem}_{timestamp}{constants.PDF_EXTENSION}")
 
 
-def limit_preview(files: Iterable[Path], limit: int) -> List[str]:
+def limit_preview(names: Iterable[str], limit: int) -> List[str]:
     """Return first N file names for preview."""
-    preview = []
-    for idx, pdf_file in enumerate(files):
-        if idx >= limit:
-            break
-        preview.append(pdf_file.name)
-    return preview
+    return list(islice(names, limit))